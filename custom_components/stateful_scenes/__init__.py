@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
-import aiofiles
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
@@ -112,6 +117,21 @@ async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
     # This allows users to use "scenes.yaml" instead of "/config/scenes.yaml"
     resolved_path = hass.config.path(scene_path)
 
+    scenes_confs = await hass.async_add_executor_job(
+        _read_scenes_file, resolved_path, scene_path
+    )
+
+    if not scenes_confs or not isinstance(scenes_confs, list):
+        raise StatefulScenesYamlInvalid(
+            f"No scenes found in {resolved_path}. "
+            "Ensure the file contains a list of scenes."
+        )
+
+    return scenes_confs
+
+
+def _read_scenes_file(resolved_path: str, scene_path: str) -> Any:
+    """Check, read and parse the scenes file in a single executor job."""
     # Check if file exists
     if not os.path.exists(resolved_path):
         raise StatefulScenesYamlNotFound(
@@ -126,8 +146,8 @@ async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
         )
 
     try:
-        async with aiofiles.open(resolved_path, encoding="utf-8") as f:
-            scenes_confs = yaml.load(await f.read(), Loader=yaml.FullLoader)
+        with open(resolved_path, "rb") as f:
+            return yaml.load(f, Loader=SafeLoader)
     except OSError as err:
         raise StatefulScenesYamlInvalid(
             f"Error reading scenes file {resolved_path}: {err}"
@@ -136,11 +156,3 @@ async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
         raise StatefulScenesYamlInvalid(
             f"Invalid YAML in {resolved_path}: {err}"
         ) from err
-
-    if not scenes_confs or not isinstance(scenes_confs, list):
-        raise StatefulScenesYamlInvalid(
-            f"No scenes found in {resolved_path}. "
-            "Ensure the file contains a list of scenes."
-        )
-
-    return scenes_confs
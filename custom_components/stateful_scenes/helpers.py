@@ -1,12 +1,20 @@
 """Helper functions for stateful_scenes."""
 
 import logging
+import re
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry, device_registry, area_registry
 from homeassistant.helpers.template import state_attr
 
 _LOGGER = logging.getLogger(__name__)
 
+_SUFFIX_RE = re.compile(
+    r"(?:_restore_on_deactivate|_ignore_unavailable|_ignore_attributes"
+    r"|_transition_time|_debounce_time|_tolerance|_off_scene)$"
+)
+
+
 def get_id_from_entity_id(hass: HomeAssistant, entity_id: str | None) -> str | None:
     """Get scene id from entity_id."""
     if entity_id is None:
@@ -51,23 +59,12 @@ def _extract_scene_id_from_unique_id(unique_id: str) -> str | None:
         return unique_id[9:]  # Remove "stateful_" prefix
 
     # Check for suffixes and remove them
-    suffixes = [
-        "_restore_on_deactivate", "_ignore_unavailable", "_ignore_attributes",
-        "_transition_time", "_debounce_time", "_tolerance", "_off_scene"
-    ]
-
-    for suffix in suffixes:
-        if unique_id.endswith(suffix):
-            return unique_id[:-len(suffix)]
+    if match := _SUFFIX_RE.search(unique_id):
+        return unique_id[: match.start()]
 
     return None
 
 
-def _get_device_entities(er: entity_registry.EntityRegistry, device_id: str) -> list:
-    """Get all entities for a device."""
-    return [entity for entity in er.entities.values() if entity.device_id == device_id]
-
-
 async def async_cleanup_orphaned_entities(hass: HomeAssistant, domain: str, entry_id: str, valid_scene_ids: set[str]) -> None:
     """Remove orphaned stateful scene entities and devices that no longer have corresponding scenes."""
     er = entity_registry.async_get(hass)
@@ -77,15 +74,15 @@ async def async_cleanup_orphaned_entities(hass: HomeAssistant, domain: str, entr
     entities_to_remove = []
     orphaned_devices = set()
 
-    for entity_id, entity in er.entities.items():
-        if entity.platform == domain and entity.config_entry_id == entry_id and entity.unique_id:
+    for entity in entity_registry.async_entries_for_config_entry(er, entry_id):
+        if entity.platform == domain and entity.unique_id:
             scene_id = _extract_scene_id_from_unique_id(entity.unique_id)
 
             if scene_id and scene_id not in valid_scene_ids:
-                entities_to_remove.append(entity_id)
+                entities_to_remove.append(entity.entity_id)
                 if entity.device_id:
                     orphaned_devices.add(entity.device_id)
-                _LOGGER.info("Marking orphaned entity for removal: %s (scene_id: %s)", entity_id, scene_id)
+                _LOGGER.info("Marking orphaned entity for removal: %s (scene_id: %s)", entity.entity_id, scene_id)
 
     # Remove orphaned entities
     for entity_id in entities_to_remove:
@@ -93,16 +90,13 @@ async def async_cleanup_orphaned_entities(hass: HomeAssistant, domain: str, entr
         er.async_remove(entity_id)
 
     # Remove all orphaned devices (both from entities removed above and existing empty devices)
-    devices_to_check = orphaned_devices.copy()
-
-    # Add all devices belonging to this integration that have no entities
-    for device_id, device in dr.devices.items():
-        if entry_id in device.config_entries and not _get_device_entities(er, device_id):
-            devices_to_check.add(device_id)
+    devices_to_check = orphaned_devices | {
+        device.id for device in device_registry.async_entries_for_config_entry(dr, entry_id)
+    }
 
     # Remove devices with no entities
     for device_id in devices_to_check:
-        if not _get_device_entities(er, device_id):
+        if not entity_registry.async_entries_for_device(er, device_id, include_disabled_entities=True):
             device = dr.devices.get(device_id)
             device_name = device.name if device else "Unknown"
             _LOGGER.info("Removing orphaned device: %s (name: %s)", device_id, device_name)